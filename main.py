@@ -6,7 +6,6 @@ import tkinter as tk
 from pathlib import Path
 from tkinter import messagebox
 
-from src.audio_capture import AudioConfig
 from src.config_loader import load_json
 from src.personal_dictionary import PersonalDictionary
 from src.storage import Storage
@@ -170,11 +169,6 @@ def main() -> None:
         rules_path = bundle_root / settings.get("text_rules_file", "config/text_rules.json")
     rules = load_json(rules_path)
 
-    audio_config = AudioConfig(
-        sample_rate_hz=int(settings.get("sample_rate_hz", 16000)),
-        channels=int(settings.get("channels", 1)),
-    )
-
     storage = Storage(
         history_file=_resolve_runtime_path(runtime_root, settings.get("history_file", "data/history.json")),
         autosave_file=_resolve_runtime_path(runtime_root, settings.get("autosave_file", "data/last_session.json")),
@@ -221,6 +215,17 @@ def main() -> None:
     }
 
     root = tk.Tk()
+
+    # Deferred import: audio_capture pulls in numpy and sounddevice (hundreds
+    # of ms); importing after the Tk root exists keeps time-to-visible-window
+    # down, matching the lazy ASR/recorder imports inside build_app.
+    from src.audio_capture import AudioConfig
+
+    audio_config = AudioConfig(
+        sample_rate_hz=int(settings.get("sample_rate_hz", 16000)),
+        channels=int(settings.get("channels", 1)),
+    )
+
     try:
         build_app(
             root=root,
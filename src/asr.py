@@ -146,6 +146,9 @@ class _QwenASREngine:
 
 
 class ASREngine:
+    # Window length for incremental decoding of long recordings.
+    _STREAM_WINDOW_SECONDS = 30
+
     def __init__(
         self,
         sample_rate_hz: int,
@@ -186,6 +189,19 @@ class ASREngine:
         if changed:
             self._engine = None
 
+    def warm_up(self) -> None:
+        """Build the backend eagerly so the first transcription skips model load.
+
+        Only warms when the model is already available locally; it never
+        triggers a download the user did not ask for.
+        """
+        if self._engine is not None:
+            return
+        target_dir = self.get_whisper_download_target_dir()
+        if target_dir is None or not target_dir.exists():
+            return
+        self._engine = self._build_engine()
+
     def transcribe(self, audio_data: np.ndarray) -> str:
         audio = np.asarray(audio_data, dtype=np.float32)
         if audio.size == 0 or not _has_voice(audio):
@@ -198,24 +214,7 @@ class ASREngine:
         except Exception as exc:  # noqa: BLE001
             if "vector too long" not in str(exc).lower():
                 raise
-            # Last-resort fallback: split by short fixed windows and skip only failing windows.
-            window = max(1, int(self.sample_rate_hz * 1))
-            texts: list[str] = []
-            failed_windows = 0
-            for start in range(0, int(audio.size), window):
-                chunk = audio[start : start + window]
-                if chunk.size == 0:
-                    continue
-                try:
-                    text = self._engine.transcribe(chunk).strip()
-                except Exception as inner_exc:  # noqa: BLE001
-                    if "vector too long" in str(inner_exc).lower():
-                        failed_windows += 1
-                        continue
-                    raise
-                if text:
-                    texts.append(text)
-            joined = " ".join(texts).strip()
+            joined, failed_windows = self._transcribe_short_windows(audio)
             if joined:
                 return joined
             if _has_voice(audio):
@@ -230,6 +229,74 @@ class ASREngine:
             raise RuntimeError("asr_empty_output")
         return ""
 
+    def _transcribe_short_windows(self, audio: np.ndarray) -> tuple[str, int]:
+        """Last-resort fallback: decode short fixed windows, skipping failing ones.
+
+        Returns the joined text and the number of windows that failed with
+        "vector too long"; other errors propagate.
+        """
+        window = max(1, int(self.sample_rate_hz * 1))
+        texts: list[str] = []
+        failed_windows = 0
+        for start in range(0, int(audio.size), window):
+            chunk = audio[start : start + window]
+            if chunk.size == 0:
+                continue
+            try:
+                text = self._engine.transcribe(chunk).strip()
+            except Exception as exc:  # noqa: BLE001
+                if "vector too long" in str(exc).lower():
+                    failed_windows += 1
+                    continue
+                raise
+            if text:
+                texts.append(text)
+        return " ".join(texts).strip(), failed_windows
+
+    def transcribe_stream(self, audio_data: np.ndarray):  # noqa: ANN201
+        """Yield cumulative transcripts while decoding long audio window by window.
+
+        Short recordings (up to one window) are decoded in a single pass, so
+        their output is identical to :meth:`transcribe`. Longer recordings are
+        split into fixed windows and the accumulated text is yielded after each
+        one, letting the caller render partial results during the decode.
+        """
+        audio = np.asarray(audio_data, dtype=np.float32)
+        window = max(1, int(self.sample_rate_hz * self._STREAM_WINDOW_SECONDS))
+        if audio.size <= window:
+            yield self.transcribe(audio)
+            return
+
+        if not _has_voice(audio):
+            yield ""
+            return
+
+        if self._engine is None:
+            self._engine = self._build_engine()
+        texts: list[str] = []
+        failed_windows = 0
+        for start in range(0, int(audio.size), window):
+            chunk = audio[start : start + window]
+            if chunk.size == 0 or not _has_voice(chunk):
+                continue
+            try:
+                text = self._engine.transcribe(chunk).strip()
+            except Exception as exc:  # noqa: BLE001
+                if "vector too long" not in str(exc).lower():
+                    raise
+                # Degrade like transcribe(): retry this window in short
+                # sub-windows and keep the partials decoded so far.
+                text, failed = self._transcribe_short_windows(chunk)
+                if not text:
+                    failed_windows += 1 if failed else 0
+            if text:
+                texts.append(text)
+                yield " ".join(texts)
+        if not texts:
+            if failed_windows > 0:
+                raise RuntimeError("asr_failed_all_windows")
+            raise RuntimeError("asr_empty_output")
+
     def _build_engine(self) -> Any:
         backend = _resolve_asr_backend(self.whisper_model_name)
         model_source = self._resolve_model_source(backend=backend)
@@ -1,4 +1,3 @@
-import queue
 import threading
 from dataclasses import dataclass
 from typing import Optional
@@ -14,10 +13,14 @@ class AudioConfig:
 
 
 class AudioRecorder:
+    # Preallocated capture capacity; grown by doubling for longer recordings.
+    _INITIAL_CAPACITY_SECONDS = 60
+
     def __init__(self, config: AudioConfig):
         self.config = config
         self._stream: Optional[sd.InputStream] = None
-        self._audio_queue: "queue.Queue[np.ndarray]" = queue.Queue()
+        self._buffer: Optional[np.ndarray] = None
+        self._write_pos = 0
         self._is_recording = False
         self._lock = threading.Lock()
 
@@ -26,6 +29,19 @@ class AudioRecorder:
         with self._lock:
             return self._is_recording
 
+    def _ensure_capacity(self, frames: int) -> None:
+        needed = self._write_pos + frames
+        if self._buffer is None:
+            capacity = max(needed, self.config.sample_rate_hz * self._INITIAL_CAPACITY_SECONDS)
+            self._buffer = np.empty((capacity, self.config.channels), dtype=np.float32)
+            return
+        if needed > self._buffer.shape[0]:
+            grown = np.empty(
+                (max(needed, self._buffer.shape[0] * 2), self.config.channels), dtype=np.float32
+            )
+            grown[: self._write_pos] = self._buffer[: self._write_pos]
+            self._buffer = grown
+
     def start(self) -> None:
         if self.is_recording:
             return
@@ -34,10 +50,14 @@ class AudioRecorder:
             if status:
                 # Callback内ではUIへ例外を投げず継続する。
                 return
-            self._audio_queue.put(indata.copy())
+            # Write into the reusable preallocated buffer instead of
+            # allocating a copy of every callback chunk.
+            self._ensure_capacity(frames)
+            self._buffer[self._write_pos : self._write_pos + frames] = indata
+            self._write_pos += frames
 
         with self._lock:
-            self._audio_queue = queue.Queue()
+            self._write_pos = 0
             self._stream = sd.InputStream(
                 samplerate=self.config.sample_rate_hz,
                 channels=self.config.channels,
@@ -58,10 +78,8 @@ class AudioRecorder:
                 self._stream = None
             self._is_recording = False
 
-        chunks = []
-        while not self._audio_queue.empty():
-            chunks.append(self._audio_queue.get())
-
-        if not chunks:
+        if self._buffer is None or self._write_pos == 0:
             return np.array([], dtype=np.float32)
-        return np.concatenate(chunks, axis=0).reshape(-1)
+        # Copy out so the capture buffer can immediately back the next
+        # recording while this audio is still being transcribed.
+        return self._buffer[: self._write_pos].reshape(-1).copy()
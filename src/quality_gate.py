@@ -1,8 +1,17 @@
-﻿import re
+﻿import functools
+import re
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 from typing import List
 
+try:
+    # Optional fast path: rapidfuzz's Indel distance uses the same
+    # 2*matches/(len_a+len_b) similarity as SequenceMatcher.ratio but
+    # computes it in C with a bit-parallel kernel.
+    from rapidfuzz.distance import Indel as _Indel
+except ImportError:  # pragma: no cover - exercised when rapidfuzz is absent
+    _Indel = None
+
 
 @dataclass
 class GateResult:
@@ -35,7 +44,16 @@ class QualityGate:
 
     @staticmethod
     def change_ratio(before: str, after: str) -> float:
-        if not before and not after:
+        if before == after:
             return 0.0
-        score = SequenceMatcher(a=before, b=after).ratio()
-        return 1.0 - score
+        return _change_ratio(before, after)
+
+
+@functools.lru_cache(maxsize=256)
+def _change_ratio(before: str, after: str) -> float:
+    # Memoized so a re-edited utterance that produces the same (raw, final)
+    # pair skips the alignment entirely.
+    if _Indel is not None:
+        return _Indel.normalized_distance(before, after)
+    score = SequenceMatcher(a=before, b=after).ratio()
+    return 1.0 - score
@@ -1,11 +1,38 @@
 import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import List
 
+try:
+    # Optional fast path: orjson serializes/parses UTF-8 bytes natively
+    # (no ensure_ascii pass, no separate encode/decode step).
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
 
-@dataclass
+
+def _json_dumps(obj, indent: bool = False) -> bytes:  # noqa: ANN001
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes):  # noqa: ANN201
+    # Files written by older builds may carry a UTF-8 BOM (we used to read
+    # with utf-8-sig); strip it so both parsers accept the bytes.
+    if data[:3] == b"\xef\xbb\xbf":
+        data = data[3:]
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass(slots=True)
 class HistoryItem:
     timestamp: str
     raw_text: str
@@ -24,6 +51,67 @@ class Storage:
         self.max_items = max_items
         self.history_file.parent.mkdir(parents=True, exist_ok=True)
         self.autosave_file.parent.mkdir(parents=True, exist_ok=True)
+        # Single-threaded writer so commits serialize without blocking the
+        # transcription pipeline.
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="storage-writer")
+        # History kept in memory after the first append so later appends skip
+        # the O(N) reload-and-reparse of the file.
+        self._history_cache: List[HistoryItem] | None = None
+        # True once the file is known to hold JSONL written this session;
+        # the line count drives rotation so the log cannot grow unbounded.
+        self._history_synced = False
+        self._history_lines = 0
+
+    @staticmethod
+    def _new_item(
+        raw_text: str,
+        final_text: str,
+        llm_applied: bool,
+        llm_latency_ms: int,
+        fallback_reason: str,
+        processing_total_ms: int,
+        processing_breakdown_ms: dict[str, int] | None,
+    ) -> HistoryItem:
+        return HistoryItem(
+            timestamp=datetime.now().isoformat(timespec="seconds"),
+            raw_text=raw_text,
+            final_text=final_text,
+            llm_applied=llm_applied,
+            llm_latency_ms=llm_latency_ms,
+            fallback_reason=fallback_reason,
+            processing_total_ms=processing_total_ms,
+            processing_breakdown_ms=processing_breakdown_ms or {},
+        )
+
+    def commit(
+        self,
+        raw_text: str,
+        final_text: str,
+        llm_applied: bool = False,
+        llm_latency_ms: int = 0,
+        fallback_reason: str = "",
+        processing_total_ms: int = 0,
+        processing_breakdown_ms: dict[str, int] | None = None,
+    ) -> None:
+        """Write autosave and append history as one background task."""
+        item = self._new_item(
+            raw_text,
+            final_text,
+            llm_applied,
+            llm_latency_ms,
+            fallback_reason,
+            processing_total_ms,
+            processing_breakdown_ms,
+        )
+        self._writer.submit(self._commit_sync, item)
+
+    def _commit_sync(self, item: HistoryItem) -> None:
+        self._write_autosave(item)
+        self._append_history_item(item)
+
+    def close(self) -> None:
+        """Flush pending writes; call on application shutdown."""
+        self._writer.shutdown(wait=True)
 
     def save_autosave(
         self,
@@ -35,28 +123,27 @@ class Storage:
         processing_total_ms: int = 0,
         processing_breakdown_ms: dict[str, int] | None = None,
     ) -> None:
-        breakdown = processing_breakdown_ms or {}
-        payload = asdict(
-            HistoryItem(
-                timestamp=datetime.now().isoformat(timespec="seconds"),
-                raw_text=raw_text,
-                final_text=final_text,
-                llm_applied=llm_applied,
-                llm_latency_ms=llm_latency_ms,
-                fallback_reason=fallback_reason,
-                processing_total_ms=processing_total_ms,
-                processing_breakdown_ms=breakdown,
+        self._write_autosave(
+            self._new_item(
+                raw_text,
+                final_text,
+                llm_applied,
+                llm_latency_ms,
+                fallback_reason,
+                processing_total_ms,
+                processing_breakdown_ms,
             )
         )
-        with self.autosave_file.open("w", encoding="utf-8") as fp:
-            json.dump(payload, fp, ensure_ascii=False, indent=2)
+
+    def _write_autosave(self, item: HistoryItem) -> None:
+        # Serialize first and write once instead of streaming json.dump's
+        # many small writes through an 8 KiB file buffer.
+        self.autosave_file.write_bytes(_json_dumps(asdict(item), indent=True))
 
     def load_autosave(self) -> HistoryItem | None:
         if not self.autosave_file.exists():
             return None
-        with self.autosave_file.open("r", encoding="utf-8-sig") as fp:
-            payload = json.load(fp)
-        return self._to_history_item(payload)
+        return self._to_history_item(_json_loads(self.autosave_file.read_bytes()))
 
     def append_history(
         self,
@@ -68,40 +155,70 @@ class Storage:
         processing_total_ms: int = 0,
         processing_breakdown_ms: dict[str, int] | None = None,
     ) -> None:
-        breakdown = processing_breakdown_ms or {}
-        current = self.load_history()
-        current.insert(
-            0,
-            HistoryItem(
-                timestamp=datetime.now().isoformat(timespec="seconds"),
-                raw_text=raw_text,
-                final_text=final_text,
-                llm_applied=llm_applied,
-                llm_latency_ms=llm_latency_ms,
-                fallback_reason=fallback_reason,
-                processing_total_ms=processing_total_ms,
-                processing_breakdown_ms=breakdown,
-            ),
+        self._append_history_item(
+            self._new_item(
+                raw_text,
+                final_text,
+                llm_applied,
+                llm_latency_ms,
+                fallback_reason,
+                processing_total_ms,
+                processing_breakdown_ms,
+            )
         )
-        current = current[: self.max_items]
-        serializable = [asdict(item) for item in current]
-        with self.history_file.open("w", encoding="utf-8") as fp:
-            json.dump(serializable, fp, ensure_ascii=False, indent=2)
+
+    def _append_history_item(self, item: HistoryItem) -> None:
+        current = self._history_cache
+        if current is None:
+            current = self._history_cache = self.load_history()
+        current.insert(0, item)
+        del current[self.max_items :]
+        if not self._history_synced or self._history_lines >= self.max_items * 2:
+            # First append this session (which also migrates a legacy JSON
+            # array in place) or rotation once the log holds twice max_items.
+            self._rewrite_history(current)
+            return
+        with self.history_file.open("ab") as fp:
+            fp.write(_json_dumps(asdict(item)) + b"\n")
+        self._history_lines += 1
+
+    def _rewrite_history(self, items: List[HistoryItem]) -> None:
+        # Oldest entry first so appends land at the end of the log. History
+        # is machine-read only; compact lines keep the bytes down (autosave
+        # keeps indentation for manual inspection).
+        data = b"".join(_json_dumps(asdict(entry)) + b"\n" for entry in reversed(items))
+        self.history_file.write_bytes(data)
+        self._history_lines = len(items)
+        self._history_synced = True
 
     def load_history(self) -> List[HistoryItem]:
         if not self.history_file.exists():
             return []
-        with self.history_file.open("r", encoding="utf-8-sig") as fp:
-            payload = json.load(fp)
-        return [self._to_history_item(item) for item in payload]
+        data = self.history_file.read_bytes()
+        if data[:3] == b"\xef\xbb\xbf":
+            data = data[3:]
+        if not data.strip():
+            return []
+        if data.lstrip()[:1] == b"[":
+            # Legacy format: one JSON array, newest first.
+            return [self._to_history_item(entry) for entry in _json_loads(data)]
+        items = [
+            self._to_history_item(_json_loads(line))
+            for line in data.splitlines()
+            if line.strip()
+        ]
+        items.reverse()
+        return items[: self.max_items]
 
     @staticmethod
     def _to_history_item(payload: dict) -> HistoryItem:
         raw_breakdown = payload.get("processing_breakdown_ms", {})
         breakdown: dict[str, int] = {}
         if isinstance(raw_breakdown, dict):
+            # Stage names and fallback reasons are low-cardinality; interning
+            # collapses the copies parsed from every record to one str each.
             for key, value in raw_breakdown.items():
-                breakdown[str(key)] = int(value)
+                breakdown[sys.intern(str(key))] = int(value)
 
         return HistoryItem(
             timestamp=payload.get("timestamp", ""),
@@ -109,7 +226,7 @@ class Storage:
             final_text=payload.get("final_text", ""),
             llm_applied=bool(payload.get("llm_applied", False)),
             llm_latency_ms=int(payload.get("llm_latency_ms", 0)),
-            fallback_reason=str(payload.get("fallback_reason", "")),
+            fallback_reason=sys.intern(str(payload.get("fallback_reason", ""))),
             processing_total_ms=int(payload.get("processing_total_ms", 0)),
             processing_breakdown_ms=breakdown,
         )
@@ -1,9 +1,79 @@
+import sys
 import time
 from typing import Callable
 
 import pyperclip
 from pynput import keyboard
 
+_IS_WINDOWS = sys.platform.startswith("win")
+
+# Win32 clipboard constants.
+_CF_UNICODETEXT = 13
+_GMEM_MOVEABLE = 0x0002
+
+
+def _copy_to_clipboard_windows(text: str) -> None:
+    # Direct Win32 clipboard write is synchronous, so no settle delay is needed
+    # before issuing the paste keystroke (pyperclip needed a ~50ms sleep).
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.windll.user32
+    kernel32 = ctypes.windll.kernel32
+
+    # Explicit signatures: ctypes defaults to c_int returns, which truncates
+    # the pointer-sized HGLOBAL/LPVOID/HANDLE values on 64-bit Windows.
+    user32.OpenClipboard.argtypes = (wintypes.HWND,)
+    user32.OpenClipboard.restype = wintypes.BOOL
+    user32.EmptyClipboard.argtypes = ()
+    user32.EmptyClipboard.restype = wintypes.BOOL
+    user32.SetClipboardData.argtypes = (wintypes.UINT, wintypes.HANDLE)
+    user32.SetClipboardData.restype = wintypes.HANDLE
+    user32.CloseClipboard.argtypes = ()
+    user32.CloseClipboard.restype = wintypes.BOOL
+    kernel32.GlobalAlloc.argtypes = (wintypes.UINT, ctypes.c_size_t)
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = (wintypes.HGLOBAL,)
+    kernel32.GlobalLock.restype = wintypes.LPVOID
+    kernel32.GlobalUnlock.argtypes = (wintypes.HGLOBAL,)
+    kernel32.GlobalUnlock.restype = wintypes.BOOL
+    kernel32.GlobalFree.argtypes = (wintypes.HGLOBAL,)
+    kernel32.GlobalFree.restype = wintypes.HGLOBAL
+
+    data = text.encode("utf-16-le") + b"\x00\x00"
+    # The clipboard is a shared resource: the freshly focused target app or a
+    # clipboard manager routinely holds it for a moment, so retry briefly
+    # (~500ms total) before surfacing a paste failure.
+    for _ in range(50):
+        if user32.OpenClipboard(None):
+            break
+        time.sleep(0.01)
+    else:
+        raise RuntimeError("clipboard_open_failed")
+    try:
+        user32.EmptyClipboard()
+        handle = kernel32.GlobalAlloc(_GMEM_MOVEABLE, len(data))
+        if not handle:
+            raise RuntimeError("clipboard_alloc_failed")
+        locked = kernel32.GlobalLock(handle)
+        if not locked:
+            kernel32.GlobalFree(handle)
+            raise RuntimeError("clipboard_lock_failed")
+        ctypes.memmove(locked, data, len(data))
+        kernel32.GlobalUnlock(handle)
+        if not user32.SetClipboardData(_CF_UNICODETEXT, handle):
+            kernel32.GlobalFree(handle)
+            raise RuntimeError("clipboard_set_failed")
+    finally:
+        user32.CloseClipboard()
+
+
+def _copy_to_clipboard(text: str) -> None:
+    if _IS_WINDOWS:
+        _copy_to_clipboard_windows(text)
+        return
+    pyperclip.copy(text)
+
 
 class SystemWideInput:
     def __init__(self, dispatch_on_ui: Callable[[Callable[[], None]], None], on_toggle: Callable[[], None]):
@@ -34,8 +104,7 @@ class SystemWideInput:
     def paste_to_active_app(self, text: str) -> None:
         if not text:
             return
-        pyperclip.copy(text)
-        time.sleep(0.05)
+        _copy_to_clipboard(text)
         with self._controller.pressed(keyboard.Key.ctrl):
             self._controller.press("v")
             self._controller.release("v")
@@ -1,4 +1,5 @@
 ﻿import difflib
+import functools
 import re
 from dataclasses import dataclass
 from typing import Dict, List
@@ -19,35 +20,86 @@ class ProcessResult:
     fallback_reason: str | None = None
 
 
+# Hoisted to module scope so the hot transforms skip the re-module cache
+# lookup on every call.
+_SPACE_RUN_PATTERN = re.compile(r"[ \t\u3000]+")
+_BLANK_LINE_PATTERN = re.compile(r"\n{3,}")
+# Punctuation and closing brackets share one class: both just drop the
+# spaces in front of them, so a single scan covers both rules.
+_SPACE_BEFORE_PUNCT_PATTERN = re.compile(r"\s+([\u3001\u3002\uff0e\uff01\uff1f!?\uff09)\u300d\u300f\u3011])")
+_SPACE_AFTER_OPEN_PATTERN = re.compile(r"([\uff08(\u300c\u300e\u3010])\s+")
+_CJK_GAP_PATTERN = re.compile(r"(?<=[\u3041-\u3093\u30a1-\u30f6\u4e00-\u9fa0\u3005\u30fc])\s+(?=[\u3041-\u3093\u30a1-\u30f6\u4e00-\u9fa0\u3005\u30fc])")
+
+
 def _normalize_whitespace(text: str) -> str:
-    text = re.sub(r"[ \t\u3000]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _SPACE_RUN_PATTERN.sub(" ", text)
+    text = _BLANK_LINE_PATTERN.sub("\n\n", text)
     return text.strip()
 
 
+_TERMINAL_PUNCTUATION = frozenset("。．.!！？?")
+
+
 def _append_terminal_punctuation(text: str) -> str:
     if not text:
         return text
-    if text[-1] in "。．.!！？?":
+    if text[-1] in _TERMINAL_PUNCTUATION:
         return text
     return f"{text}。"
 
 
-def _remove_fillers(text: str, filler_words: List[str]) -> str:
-    result = text
-    if filler_words:
-        pattern = r"|".join(re.escape(word) for word in filler_words if word)
+# Remove common spoken fillers that often survive ASR tokenization.
+_GENERIC_FILLER_PATTERN = re.compile(
+    r"(?:(?<=^)|(?<=[\s、。,.!?！？]))"
+    r"(?:えー+|えっと|えーと|あの|その)"
+    r"(?:(?=[\s、。,.!?！？])|$)"
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _compile_filler_pattern(words: tuple) -> "re.Pattern[str]":
+    # User words only; the generic pattern stays a separate second pass
+    # because removing a user word can create the boundary the generic
+    # pattern's assertions need (まあえー、 -> えー、 only matches after
+    # まあ is gone), so fusing the two changes the output.
+    return re.compile("|".join(re.escape(word) for word in words))
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_habit_pattern(pattern: str) -> "re.Pattern[str]":
+    return re.compile(pattern)
+
+
+def warm_rules(rules: Dict[str, List]) -> None:
+    """Precompile the rule patterns so the first transcription skips regex build.
+
+    The compiled patterns are memoized (see ``_compile_filler_pattern`` /
+    ``_compile_habit_pattern``); calling this at startup just moves the
+    one-time compile cost off the first utterance.
+    """
+    key = _filler_key(rules.get("filler_words", []))
+    if key:
+        _compile_filler_pattern(key)
+    for rule in rules.get("habit_patterns", []):
+        pattern = rule.get("pattern", "")
         if pattern:
-            result = re.sub(pattern, "", result)
+            _compile_habit_pattern(pattern)
 
-    # Remove common spoken fillers that often survive ASR tokenization.
-    generic_filler = (
-        r"(?:(?<=^)|(?<=[\s、。,.!?！？]))"
-        r"(?:えー+|えっと|えーと|あの|その)"
-        r"(?:(?=[\s、。,.!?！？])|$)"
-    )
-    result = re.sub(generic_filler, "", result)
-    return _normalize_whitespace(result)
+
+def _filler_key(filler_words: List[str]) -> tuple:
+    # Dedupe and sort so reordered rule files hit the same cached pattern.
+    # Longest first: user words carry no boundary assertions, so a shorter
+    # word ahead of a longer one it prefixes would shadow it in the
+    # alternation (えー before えーと would leave the と behind).
+    return tuple(sorted({word for word in filler_words if word}, key=lambda w: (-len(w), w)))
+
+
+def _remove_fillers(text: str, filler_words: List[str]) -> str:
+    key = _filler_key(filler_words)
+    if key:
+        text = _compile_filler_pattern(key).sub("", text)
+    text = _GENERIC_FILLER_PATTERN.sub("", text)
+    return _normalize_whitespace(text)
 
 
 def _remove_habits(text: str, habit_patterns: List[Dict[str, str]]) -> str:
@@ -57,7 +109,7 @@ def _remove_habits(text: str, habit_patterns: List[Dict[str, str]]) -> str:
         replace = rule.get("replace", "")
         if not pattern:
             continue
-        output = re.sub(pattern, replace, output)
+        output = _compile_habit_pattern(pattern).sub(replace, output)
     return _normalize_whitespace(output)
 
 
@@ -70,10 +122,9 @@ def _auto_edit(text: str) -> str:
 
 def _tighten_japanese_spacing(text: str) -> str:
     # Keep Latin-word spacing, but remove unnatural spaces around Japanese text.
-    text = re.sub(r"\s+([、。．！？!?])", r"\1", text)
-    text = re.sub(r"([（(「『【])\s+", r"\1", text)
-    text = re.sub(r"\s+([）)」』】])", r"\1", text)
-    text = re.sub(r"(?<=[ぁ-んァ-ヶ一-龠々ー])\s+(?=[ぁ-んァ-ヶ一-龠々ー])", "", text)
+    text = _SPACE_BEFORE_PUNCT_PATTERN.sub(r"\1", text)
+    text = _SPACE_AFTER_OPEN_PATTERN.sub(r"\1", text)
+    text = _CJK_GAP_PATTERN.sub("", text)
     return text
 
 
@@ -106,6 +157,11 @@ def process_text(
     rules: Dict[str, List[Dict[str, str]]],
     options: ProcessOptions,
 ) -> ProcessResult:
+    if not (options.remove_fillers or options.remove_habits or options.auto_edit):
+        # All processing disabled: the text passes through untouched, so skip
+        # the rule scans and the diff for the edit list.
+        return ProcessResult(preprocessed_text=raw_text, final_text=raw_text, edits=[])
+
     output = raw_text
     if options.remove_fillers:
         output = _remove_fillers(output, rules.get("filler_words", []))
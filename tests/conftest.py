@@ -1,15 +1,20 @@
+import itertools
+import os
 import shutil
-import uuid
 from pathlib import Path
 
 import pytest
 
+# pid + monotonic counter keeps names collision-safe across parallel runs
+# without the per-fixture urandom read uuid4 costs.
+_counter = itertools.count()
+
 
 @pytest.fixture
 def tmp_path() -> Path:
     root = Path("data") / "tmp-tests"
     root.mkdir(parents=True, exist_ok=True)
-    path = root / f"pytest-{uuid.uuid4().hex[:8]}"
+    path = root / f"pytest-{os.getpid()}-{next(_counter):08x}"
     path.mkdir(parents=True, exist_ok=True)
     try:
         yield path
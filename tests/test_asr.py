@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from src.asr import ASREngine
+
+# transcribe_stream splits at _STREAM_WINDOW_SECONDS; a tiny sample rate keeps
+# the test arrays small (window = 2 Hz * 30 s = 60 samples).
+_SAMPLE_RATE_HZ = 2
+_WINDOW_SAMPLES = _SAMPLE_RATE_HZ * ASREngine._STREAM_WINDOW_SECONDS
+
+
+class _ScriptedEngine:
+    """Backend stub mapping each chunk's first sample to a canned response."""
+
+    def __init__(self, script: dict):
+        self.script = script
+
+    def transcribe(self, chunk: np.ndarray) -> str:
+        action = self.script[round(float(chunk[0]), 2)]
+        if isinstance(action, Exception):
+            raise action
+        return action
+
+
+def _make_engine(script: dict) -> ASREngine:
+    engine = ASREngine(sample_rate_hz=_SAMPLE_RATE_HZ)
+    engine._engine = _ScriptedEngine(script)
+    return engine
+
+
+def _window(value: float, samples: int = _WINDOW_SAMPLES) -> np.ndarray:
+    # Constant amplitude above the _has_voice threshold.
+    return np.full(samples, value, dtype=np.float32)
+
+
+def test_transcribe_stream_yields_cumulative_partials() -> None:
+    engine = _make_engine({0.1: "hello", 0.2: "world"})
+    audio = np.concatenate([_window(0.1), _window(0.2)])
+
+    assert list(engine.transcribe_stream(audio)) == ["hello", "hello world"]
+
+
+def test_transcribe_stream_recovers_failing_window_with_short_windows() -> None:
+    # The second window fails whole but its last 1-second slice decodes in
+    # the fallback windows; earlier partials must survive.
+    engine = _make_engine(
+        {
+            0.1: "hello",
+            0.2: RuntimeError("vector too long"),
+            0.3: "tail",
+        }
+    )
+    bad_window = np.concatenate(
+        [_window(0.2, _WINDOW_SAMPLES - _SAMPLE_RATE_HZ), _window(0.3, _SAMPLE_RATE_HZ)]
+    )
+    audio = np.concatenate([_window(0.1), bad_window])
+
+    assert list(engine.transcribe_stream(audio)) == ["hello", "hello tail"]
+
+
+def test_transcribe_stream_raises_only_when_every_window_fails() -> None:
+    engine = _make_engine(
+        {
+            0.1: RuntimeError("vector too long"),
+            0.2: RuntimeError("vector too long"),
+        }
+    )
+    audio = np.concatenate([_window(0.1), _window(0.2)])
+
+    with pytest.raises(RuntimeError, match="asr_failed_all_windows"):
+        list(engine.transcribe_stream(audio))
+
+
+def test_transcribe_stream_propagates_unexpected_errors() -> None:
+    engine = _make_engine({0.1: "hello", 0.2: RuntimeError("device lost")})
+    audio = np.concatenate([_window(0.1), _window(0.2)])
+
+    with pytest.raises(RuntimeError, match="device lost"):
+        list(engine.transcribe_stream(audio))
@@ -1,15 +1,18 @@
+import itertools
 import json
+import os
 import shutil
-import uuid
 from pathlib import Path
 
 from src.autonomous_agent import ExternalAPIAutonomousAgent, InternalAutonomousAgent
 
+_workspace_counter = itertools.count()
+
 
 def _make_workspace() -> Path:
     root = Path("data") / "tmp-tests"
     root.mkdir(parents=True, exist_ok=True)
-    workspace = root / f"agent-test-{uuid.uuid4().hex[:8]}"
+    workspace = root / f"agent-test-{os.getpid()}-{next(_workspace_counter):08x}"
     workspace.mkdir(parents=True, exist_ok=True)
     return workspace
 
@@ -51,6 +51,24 @@ def test_storage_saves_llm_metadata(tmp_path: Path) -> None:
     assert items[0].processing_breakdown_ms == {}
 
 
+def test_storage_commit_writes_autosave_and_history(tmp_path: Path) -> None:
+    storage = Storage(
+        history_file=tmp_path / "history.json",
+        autosave_file=tmp_path / "autosave.json",
+        max_items=10,
+    )
+
+    storage.commit(raw_text="raw", final_text="final", llm_applied=True, llm_latency_ms=5)
+    storage.close()
+
+    autosave = storage.load_autosave()
+    assert autosave is not None
+    assert autosave.final_text == "final"
+    items = storage.load_history()
+    assert len(items) == 1
+    assert items[0].llm_applied is True
+
+
 def test_storage_saves_processing_timing_metadata(tmp_path: Path) -> None:
     storage = Storage(
         history_file=tmp_path / "history.json",
@@ -72,3 +90,54 @@ def test_storage_saves_processing_timing_metadata(tmp_path: Path) -> None:
     assert items[0].processing_total_ms == 456
     assert items[0].processing_breakdown_ms["asr"] == 100
     assert items[0].processing_breakdown_ms["llm"] == 200
+
+
+def test_storage_migrates_legacy_array_to_jsonl_on_first_append(tmp_path: Path) -> None:
+    history_path = tmp_path / "history.json"
+    history_path.write_text(
+        json.dumps([
+            {
+                "timestamp": "2026-02-16T10:00:00",
+                "raw_text": "old",
+                "final_text": "old"
+            }
+        ], ensure_ascii=False),
+        encoding="utf-8",
+    )
+
+    storage = Storage(
+        history_file=history_path,
+        autosave_file=tmp_path / "autosave.json",
+        max_items=10,
+    )
+    storage.append_history(raw_text="new", final_text="new")
+
+    # File was rewritten in place as JSONL (one object per line, no array).
+    assert history_path.read_bytes().lstrip()[:1] == b"{"
+    items = storage.load_history()
+    assert [item.raw_text for item in items] == ["new", "old"]
+
+
+def test_storage_rotation_caps_file_and_keeps_newest(tmp_path: Path) -> None:
+    history_path = tmp_path / "history.json"
+    storage = Storage(
+        history_file=history_path,
+        autosave_file=tmp_path / "autosave.json",
+        max_items=3,
+    )
+
+    for n in range(10):
+        storage.append_history(raw_text=f"raw{n}", final_text=f"final{n}")
+
+    lines = [line for line in history_path.read_bytes().splitlines() if line.strip()]
+    assert len(lines) <= storage.max_items * 2
+
+    expected = ["raw9", "raw8", "raw7"]
+    assert [item.raw_text for item in storage.load_history()] == expected
+    # A fresh instance reading the rotated log sees the same entries.
+    reloaded = Storage(
+        history_file=history_path,
+        autosave_file=tmp_path / "autosave.json",
+        max_items=3,
+    )
+    assert [item.raw_text for item in reloaded.load_history()] == expected
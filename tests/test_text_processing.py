@@ -25,3 +25,31 @@ def test_process_text_preserves_latin_word_spacing() -> None:
     )
 
     assert result.final_text == "Open AI model test。"
+
+
+def test_process_text_prefers_longest_filler_over_prefix() -> None:
+    raw = "えーとですね"
+    rules = {"filler_words": ["えー", "えーと"], "habit_patterns": []}
+
+    result = process_text(
+        raw,
+        rules,
+        ProcessOptions(auto_edit=False, remove_fillers=True, remove_habits=False),
+    )
+
+    assert result.final_text == "ですね"
+
+
+def test_process_text_removes_adjacent_user_and_generic_fillers() -> None:
+    # Removing a user filler must expose the boundary the generic pattern
+    # needs for the filler that follows it.
+    raw = "まあえー、今日は晴れです"
+    rules = {"filler_words": ["まあ", "なんか"], "habit_patterns": []}
+
+    result = process_text(
+        raw,
+        rules,
+        ProcessOptions(auto_edit=False, remove_fillers=True, remove_habits=False),
+    )
+
+    assert result.final_text == "、今日は晴れです"